@@ -41,7 +41,14 @@
 
 # System level packages.
 import sys
-from operator import attrgetter
+from operator import attrgetter, itemgetter
+
+# Optional packages.
+# NumPy is used to accelerate bulk sorting and filtering if available.
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 # Local packages.
 from wsjtxmon import wsjtxmon
@@ -55,6 +62,12 @@ class FT8Decode(object):
     FT8Decode class used for processing of FT8 decoded messages from WSJT-X.
     """
 
+    # Fixed attribute set; avoids a per-instance __dict__ and shrinks
+    # memory when holding many decodes.
+    __slots__ = ('classname', 'id_str', 'new', 'time', 'snr', 'dt', 'df',
+        'mode_str', 'msg_str', 'low_conf', 'off_air', 'is_cq',
+        'qrm', 'qrm_o', 'esnr', 'nsig', 'Reply')
+
     # ------------------------------------------------------------------------
     def __init__(self, msg=[]):
         """
@@ -73,21 +86,20 @@ class FT8Decode(object):
         self.classname = type(self).__name__
         
         # WSJT-X decode message parameters.
+        # The formatted *_str versions of the numeric parameters are
+        # derived on demand by the properties below.
         self.id_str   = ''
         self.new      = 0
-        self.time_str = ''
         self.time     = 0
-        self.snr_str  = ''
         self.snr      = 0
-        self.dt_str   = ''
         self.dt       = 0
-        self.df_str   = ''
         self.df       = 0
         self.mode_str = ''
         self.msg_str  = ''
         self.low_conf = 0
         self.off_air  = 0
-        
+        self.is_cq    = False  # True if the message text is a CQ call
+
         self.qrm   = 0.0  # Adjacent signal interference value (QRM)
         self.qrm_o = 0.0  # QRM with SNR offset
         self.esnr  = 0.0  # Effective SNR (with QRM factored in)
@@ -99,25 +111,113 @@ class FT8Decode(object):
         if (msg_len > 0):
             if (msg[0] == wsjtxmon.MSG_DECODE):
                 if (msg_len >= 11):
-                    self.id_str   = str(msg[1])
+                    # Convert each field exactly once; the *_str forms
+                    # are derived lazily from the typed values.
+                    # The ID and mode strings repeat across every decode
+                    # in a session, so intern them to share one copy.
+                    self.id_str   = sys.intern(str(msg[1]))
                     self.new      = int(msg[2])
-                    self.time_str = str(msg[3])
                     self.time     = int(msg[3])
-                    self.snr_str  = str(msg[4])
                     self.snr      = int(msg[4])
-                    self.dt_str   = str(msg[5])
                     self.dt       = float(msg[5])
-                    self.df_str   = str(msg[6])
                     self.df       = int(msg[6])
-                    self.mode_str = str(msg[7])
+                    self.mode_str = sys.intern(str(msg[7]))
                     self.msg_str  = str(msg[8])
                     self.low_conf = int(msg[9])
                     self.off_air  = int(msg[10])
+                    self.is_cq    = self.msg_str.startswith('CQ ')
                 else:
                     print(self.classname + ': Invalid decode message length.')
             else:
                 print(self.classname + ': Invalid decode message initializer.')
 
+    # ------------------------------------------------------------------------
+    @classmethod
+    def from_batch(cls, msg_list):
+        """
+        Convert a batch of wsjtxmon MSG_DECODE messages to FT8Decode objects.
+
+        Parameters
+        ----------
+        msg_list : list
+            A list of wsjtxmon MSG_DECODE messages.
+            See wsjtxmon.py for details.
+
+        Returns
+        -------
+        decode_list : list
+            A list of FT8Decode objects, one per input message.
+        """
+        return [cls(msg) for msg in msg_list]
+
+    # ------------------------------------------------------------------------
+    @staticmethod
+    def sorted_by(decode_list, field, reverse=False):
+        """
+        Sort a list of FT8Decode objects by the named numeric field.
+        Uses a NumPy column argsort when NumPy is available, which beats
+        a key-function sort for the large batches typical of band scans;
+        falls back to sorted() with attrgetter otherwise.
+
+        Parameters
+        ----------
+        decode_list : list
+            The list of FT8Decode objects to sort.
+        field : str
+            The numeric field to sort by ('time', 'snr', 'dt' or 'df').
+        reverse : bool
+            Sort in descending order if True.
+
+        Returns
+        -------
+        sorted_list : list
+            A new list of FT8Decode objects in sorted order.
+        """
+        if numpy is None:
+            return sorted(decode_list, key=attrgetter(field), reverse=reverse)
+        num = len(decode_list)
+        column = numpy.fromiter(
+            (getattr(d, field) for d in decode_list), 'f8', num)
+        # Negate for descending order rather than reversing the ascending
+        # result, so equal keys keep their original relative order just as
+        # sorted(..., reverse=True) does in the fallback path.
+        if reverse:
+            column = -column
+        indices = numpy.argsort(column, kind='stable')
+        return [decode_list[i] for i in indices]
+
+    # ------------------------------------------------------------------------
+    @property
+    def time_str(self):
+        """
+        The decode time formatted as a HHMMSS string.
+        """
+        return '%06d' % self.time
+
+    # ------------------------------------------------------------------------
+    @property
+    def snr_str(self):
+        """
+        The SNR formatted as a signed string, e.g. '+14'.
+        """
+        return '%+03d' % self.snr
+
+    # ------------------------------------------------------------------------
+    @property
+    def dt_str(self):
+        """
+        The delta time formatted as a signed string, e.g. '+0.1'.
+        """
+        return '%+.1f' % self.dt
+
+    # ------------------------------------------------------------------------
+    @property
+    def df_str(self):
+        """
+        The delta frequency formatted as a four character string, e.g. ' 340'.
+        """
+        return '%4d' % self.df
+
     # ------------------------------------------------------------------------
     def __repr__(self):
         """
@@ -130,12 +230,7 @@ class FT8Decode(object):
         """
         Stringify the FT8Decode object for printing.
         """
-        my_list = self.tolist()
-        my_str = '[' 
-        for val in my_list:
-            my_str += str(val) + ', '
-        my_str = my_str[:-2] + ']'  # Remove trailing comma at end of list
-        return my_str
+        return '[' + ', '.join(map(str, self.tolist())) + ']'
         
     # ------------------------------------------------------------------------
     def tolist(self):
@@ -148,7 +243,7 @@ class FT8Decode(object):
             self.time_str,
             self.snr_str,
             self.dt_str,
-            str(self.df),
+            self.df_str,
             self.mode_str,
             self.msg_str,
             self.low_conf,
@@ -156,6 +251,107 @@ class FT8Decode(object):
         return my_list
 
 
+##############################################################################
+# FT8DecodeArray class.
+##############################################################################
+
+class FT8DecodeArray(object):
+    """
+    Structure-of-arrays container for bulk processing of FT8 decoded messages.
+    Each numeric field is stored as a flat column so that large batches can
+    be sorted and filtered without per-object attribute lookups.  The columns
+    are NumPy arrays when NumPy is available and plain lists otherwise.
+    """
+
+    # ------------------------------------------------------------------------
+    def __init__(self, msg_list=[]):
+        """
+        Class constructor.
+
+        Parameters
+        ----------
+        msg_list : list
+            An optional list of wsjtxmon MSG_DECODE messages used to
+            initialize this object.  See wsjtxmon.py for details.
+
+        Returns
+        -------
+        None.
+        """
+        self.decodes = FT8Decode.from_batch(msg_list)
+        num = len(self.decodes)
+
+        # Build the field columns in a single pass.
+        if numpy is not None:
+            self.time = numpy.fromiter((d.time for d in self.decodes), 'i4', num)
+            self.snr  = numpy.fromiter((d.snr  for d in self.decodes), 'i4', num)
+            self.dt   = numpy.fromiter((d.dt   for d in self.decodes), 'f4', num)
+            self.df   = numpy.fromiter((d.df   for d in self.decodes), 'i4', num)
+        else:
+            self.time = [d.time for d in self.decodes]
+            self.snr  = [d.snr  for d in self.decodes]
+            self.dt   = [d.dt   for d in self.decodes]
+            self.df   = [d.df   for d in self.decodes]
+        self.msg_str = [d.msg_str for d in self.decodes]
+
+    # ------------------------------------------------------------------------
+    def __len__(self):
+        """
+        Return the number of decoded messages in the container.
+        """
+        return len(self.decodes)
+
+    # ------------------------------------------------------------------------
+    def __iter__(self):
+        """
+        Iterate over the decoded messages as FT8Decode objects.
+        """
+        return iter(self.decodes)
+
+    # ------------------------------------------------------------------------
+    def argsort_by(self, field, reverse=False):
+        """
+        Return the indices that would sort the container by the named field.
+
+        Parameters
+        ----------
+        field : str
+            The column to sort by ('time', 'snr', 'dt' or 'df').
+        reverse : bool
+            Sort in descending order if True.
+
+        Returns
+        -------
+        index_list : list
+            The decode indices in sorted order.
+        """
+        column = getattr(self, field)
+        if numpy is not None:
+            # Negate for descending order so equal keys keep their
+            # original relative order, matching the fallback path.
+            indices = numpy.argsort(-column if reverse else column,
+                kind='stable')
+        else:
+            indices = sorted(range(len(column)),
+                key=column.__getitem__, reverse=reverse)
+        return indices
+
+    # ------------------------------------------------------------------------
+    def sorted_by(self, field, reverse=False):
+        """
+        Return the FT8Decode objects sorted by the named field.
+        See argsort_by() for parameter details.
+        """
+        return [self.decodes[i] for i in self.argsort_by(field, reverse)]
+
+    # ------------------------------------------------------------------------
+    def cq_decodes(self):
+        """
+        Return the FT8Decode objects whose message text is a CQ call.
+        """
+        return [d for d in self.decodes if d.is_cq]
+
+
 ###############################################################################
 # Main program.
 ###############################################################################
@@ -202,19 +398,21 @@ if __name__ == "__main__":
     ]
     
     # Convert WSJT-X decoded messages to FT8Decode objects.
-    my_decode = []
-    for msg in my_msg:
-        my_decode.append(FT8Decode(msg))
+    my_decode = FT8Decode.from_batch(my_msg)
     
     # Example 1: sort by frequency.
-    my_decode_sorted = sorted(my_decode, key=attrgetter('df'))
+    my_decode_sorted = FT8Decode.sorted_by(my_decode, 'df')
     print('Decoded messages sorted by frequency: ')
     for d in my_decode_sorted:
         print('  ', d)
         
     # Example 2: Print CQ messages reverse sorted by SNR.
-    my_decode_sorted = sorted(my_decode, key=attrgetter('snr'), reverse=True)
+    # Decorate with the sort key once so each comparison is a C-level
+    # tuple item fetch instead of an attribute lookup.
+    my_keyed = [(d.snr, d) for d in my_decode]
+    my_keyed.sort(key=itemgetter(0), reverse=True)
+    my_decode_sorted = [k[1] for k in my_keyed]
     print('CQ messages reverse sorted by SNR: ')
     for d in my_decode_sorted:
-        if d.msg_str.startswith('CQ '):
+        if d.is_cq:
             print('  ', d)
@@ -42,14 +42,24 @@
 # POSSIBILITY OF SUCH DAMAGE.
 ###############################################################################
 
-# Local packages.
-import decode
-import encode
+# System level packages.
+import struct
+
+# Optional packages.
+# NumPy is used to accelerate bulk RGBA conversion if available.
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 ##############################################################################
 # Global objects and data.
 ##############################################################################
 
+# Pre-compiled serializer for the 11-byte ARGB stream.
+# Fields are cspec, alpha, red, green, blue, pad in little-endian format.
+_QCOLOR_STRUCT = struct.Struct('<BHHHHH')
+
 
 ##############################################################################
 # Functions.
@@ -78,11 +88,10 @@ def rgba_join(red, grn, blu, alpha=0xFF):
     rgba : int
         A 32-bit composite RGBA value.
     """
-    rgba = ((red & 0xFF) << 24) \
-        + ((grn & 0xFF) << 16)  \
-        + ((blu & 0xFF) << 8)   \
-        + (alpha & 0xFF)
-    return rgba
+    return ((red & 0xFF) << 24) \
+         | ((grn & 0xFF) << 16) \
+         | ((blu & 0xFF) << 8)  \
+         | (alpha & 0xFF)
 
 # ------------------------------------------------------------------------
 def rgba_split(rgba):
@@ -99,14 +108,61 @@ def rgba_split(rgba):
     (red, grn, blu, alpha) : tuple
         A tuple of individual red, green, blue and alpha values.
     """
-    alpha = (rgba & 0xFF)
-    rgba >>= 8
-    blu = (rgba & 0xFF)
-    rgba >>= 8
-    grn = (rgba & 0xFF)
-    rgba >>= 8
-    red = (rgba & 0xFF)
-    return (red, grn, blu, alpha)
+    b = rgba.to_bytes(4, 'big')
+    return (b[0], b[1], b[2], b[3])
+
+# ------------------------------------------------------------------------
+def rgba_join_array(red, grn, blu, alpha):
+    """
+    Join arrays of red, green, blue and alpha values into an array of
+    composite RGBA values.  Uses vectorized NumPy bitwise operations when
+    NumPy is available and a scalar loop otherwise.
+
+    Parameters
+    ----------
+    red, grn, blu, alpha : array_like
+        Sequences of component values (0-255), all the same length.
+
+    Returns
+    -------
+    rgba : array_like
+        The 32-bit composite RGBA values, as a NumPy uint32 array when
+        NumPy is available, otherwise as a list.
+    """
+    if numpy is not None:
+        return ((numpy.asarray(red, numpy.uint32)   & 0xFF) << 24) \
+             | ((numpy.asarray(grn, numpy.uint32)   & 0xFF) << 16) \
+             | ((numpy.asarray(blu, numpy.uint32)   & 0xFF) << 8)  \
+             | (numpy.asarray(alpha, numpy.uint32)  & 0xFF)
+    return [rgba_join(r, g, b, a) for (r, g, b, a) in zip(red, grn, blu, alpha)]
+
+# ------------------------------------------------------------------------
+def rgba_split_array(rgba):
+    """
+    Split an array of 32-bit composite RGBA values into component arrays.
+    Uses vectorized NumPy bitwise operations when NumPy is available and
+    a scalar loop otherwise.
+
+    Parameters
+    ----------
+    rgba : array_like
+        A sequence of 32-bit composite RGBA values.
+
+    Returns
+    -------
+    (red, grn, blu, alpha) : tuple
+        A tuple of component value arrays, as NumPy uint8 arrays when
+        NumPy is available, otherwise as lists.
+    """
+    if numpy is not None:
+        v = numpy.asarray(rgba, numpy.uint32)
+        return (((v >> 24) & 0xFF).astype(numpy.uint8),
+                ((v >> 16) & 0xFF).astype(numpy.uint8),
+                ((v >> 8)  & 0xFF).astype(numpy.uint8),
+                (v         & 0xFF).astype(numpy.uint8))
+    parts = [rgba_split(v) for v in rgba]
+    return ([p[0] for p in parts], [p[1] for p in parts],
+            [p[2] for p in parts], [p[3] for p in parts])
 
 
 ##############################################################################
@@ -120,6 +176,12 @@ class QColor (object):
     interfacing with applications that use Qt.
     This class serializes the color encoding as ARGB (alpha, red, green, blue).
     """
+
+    # Fixed attribute set; avoids a per-instance __dict__ when building
+    # many transient colors.
+    __slots__ = ('__version__', 'cspec', 'red', 'grn', 'blu', 'alpha',
+        'pad', '_array')
+
     # Qt color specification enumerated type.
     CSPEC_INVALID      = int(0)
     CSPEC_RGB          = int(1)
@@ -154,8 +216,38 @@ class QColor (object):
     
     # Not part of Qt spec.
     # An invalid color clears and cancels WSJT-X highlighting.
-    COLOR_INVALID = int(255)  
-    
+    COLOR_INVALID = int(255)
+
+    # Color name lookup table mapping name --> (red, grn, blu, alpha).
+    # An alpha entry of None means use the caller supplied alpha value.
+    _NAME_TABLE = {
+        COLOR_BLACK        : (0x00, 0x00, 0x00, None),
+        COLOR_WHITE        : (0xFF, 0xFF, 0xFF, None),
+        COLOR_DARK_GRAY    : (0x80, 0x80, 0x80, None),
+        COLOR_GRAY         : (0xA0, 0xA0, 0xA4, None),
+        COLOR_LIGHT_GRAY   : (0xC0, 0xC0, 0xC0, None),
+        COLOR_RED          : (0xFF, 0x00, 0x00, None),
+        COLOR_GREEN        : (0x00, 0xFF, 0x00, None),
+        COLOR_BLUE         : (0x00, 0x00, 0xFF, None),
+        COLOR_CYAN         : (0x00, 0xFF, 0xFF, None),
+        COLOR_MAGENTA      : (0xFF, 0x00, 0xFF, None),
+        COLOR_YELLOW       : (0xFF, 0xFF, 0x00, None),
+        COLOR_DARK_RED     : (0x80, 0x00, 0x00, None),
+        COLOR_DARK_GREEN   : (0x00, 0x80, 0x00, None),
+        COLOR_DARK_BLUE    : (0x00, 0x00, 0x80, None),
+        COLOR_DARK_CYAN    : (0x00, 0x80, 0x80, None),
+        COLOR_DARK_MAGENTA : (0x80, 0x00, 0x80, None),
+        COLOR_DARK_YELLOW  : (0x80, 0x80, 0x00, None),
+        COLOR_ORANGE       : (0xFF, 0xA5, 0x00, None),
+        COLOR_DARK_VIOLET  : (0x94, 0x00, 0xD3, None),
+        COLOR_TRANSPARENT  : (0x00, 0x00, 0x00, 0x00),
+        COLOR_INVALID      : (0xFFFF, 0xFFFF, 0xFFFF, 0xFFFF),
+    }
+
+    # Cache of pre-encoded byte streams keyed by (name, alpha).
+    # Populated at module load below the class definition.
+    _ENCODED_CACHE = {}
+
     # ------------------------------------------------------------------------
     def __init__(self, *, name=None, rgba=None, alpha=0xFF):
         """
@@ -186,10 +278,10 @@ class QColor (object):
         self.blu     = 0               # Default blue value
         self.alpha   = alpha & 0xFF    # Default alpha value
         self.pad     = 0               # Pad value (used only for CMYK color spec)
-        self._endian = 'little'        # Assumes data is transferred in little endian format
-        
-        # Initialize a serialized byte array.
-        self.array = bytearray(encode.byte(self.CSPEC_RGB, self._endian))
+
+        # The serialized byte array is built lazily by encode() or on
+        # first access of the array property.
+        self._array = None
 
         if name is not None:
             # Optional initialization using a pre-defined color name.
@@ -198,6 +290,17 @@ class QColor (object):
             # Optional initialization using a 32-bit color value.
             self.setByValue(rgba=rgba)
 
+    # ------------------------------------------------------------------------
+    @property
+    def array(self):
+        """
+        The serialized byte stream for this color as a bytes object.
+        Encoded lazily on first access.
+        """
+        if self._array is None:
+            self.encode()
+        return bytes(self._array)
+
     # ------------------------------------------------------------------------
     def encode(self, red=-1, grn=-1, blu=-1, alpha=-1):
         """
@@ -219,20 +322,21 @@ class QColor (object):
         
         Returns
         -------
-        A bytearray containing the encoded data.
+        A bytes object containing the encoded data.
         """
         if (red >= 0): self.red = red & 0xFF
         if (grn >= 0): self.grn = grn & 0xFF
         if (blu >= 0): self.blu = blu & 0xFF
         if (alpha >= 0): self.alpha = alpha & 0xFF
-        
-        self.array = bytearray(encode.byte(self.cspec, self._endian))
-        self.array.extend(encode.uword(self.alpha, self._endian))
-        self.array.extend(encode.uword(self.red, self._endian))
-        self.array.extend(encode.uword(self.grn, self._endian))
-        self.array.extend(encode.uword(self.blu, self._endian))
-        self.array.extend(encode.uword(self.pad, self._endian))
-        return self.array
+
+        # Pack all fields into the reused scratch buffer in a single call,
+        # then return an immutable snapshot so a result held by the caller
+        # is not mutated by a later encode on this instance.
+        if (self._array is None):
+            self._array = bytearray(_QCOLOR_STRUCT.size)
+        _QCOLOR_STRUCT.pack_into(self._array, 0, self.cspec, self.alpha,
+            self.red, self.grn, self.blu, self.pad)
+        return bytes(self._array)
         
         
     # ------------------------------------------------------------------------
@@ -253,47 +357,13 @@ class QColor (object):
             True if decoding was successful, False otherwise.  
             The instance variables cspec, red, grn, blu, alpha and pad are modified.
         """
-        status = True
-        index  = 0
-        remain = len(data)
-        
-        if (remain >= 1):
-            self.cspec = decode.byte(data[index:index+1], endian=self._endian)
-            index += 1
-            remain -= 1
-        else: status = False
-        
-        if status & (remain >= 2):
-            self.alpha = decode.uword(data[index:index+2], endian=self._endian)
-            index += 2
-            remain -= 2
-        else: status = False
-        
-        if status & (remain >= 2):
-            self.red = decode.uword(data[index:index+2], endian=self._endian)
-            index += 2
-            remain -= 2
-        else: status = False
-        
-        if status & (remain >= 2):
-            self.grn = decode.uword(data[index:index+2], endian=self._endian)
-            index += 2
-            remain -= 2
-        else: status = False
-        
-        if status & (remain >= 2):
-            self.blu = decode.uword(data[index:index+2], endian=self._endian)
-            index += 2
-            remain -= 2
-        else: status = False
-        
-        if status & (remain >= 2):
-            self.pad = decode.uword(data[index:index+2], endian=self._endian)
-            index += 2
-            remain -= 2
-        else: status = False
+        if (len(data) < _QCOLOR_STRUCT.size):
+            return False
 
-        return status
+        # Unpack all fields in a single call.
+        (self.cspec, self.alpha, self.red, self.grn, self.blu, self.pad) = \
+            _QCOLOR_STRUCT.unpack_from(data, 0)
+        return True
         
         
     # ------------------------------------------------------------------------
@@ -323,96 +393,40 @@ class QColor (object):
         else:
             self.alpha = 0xFF
         
-        # Set the color by name.
-        if (name == self.COLOR_BLACK):
-            self.red = 0x00
-            self.grn = 0x00
-            self.blu = 0x00
-        elif (name == self.COLOR_WHITE):
-            self.red = 0xFF
-            self.grn = 0xFF
-            self.blu = 0xFF
-        elif (name == self.COLOR_DARK_GRAY):
-            self.red = 0x80
-            self.grn = 0x80
-            self.blu = 0x80
-        elif (name == self.COLOR_GRAY):
-            self.red = 0xA0
-            self.grn = 0xA0
-            self.blu = 0xA4
-        elif (name == self.COLOR_LIGHT_GRAY):
-            self.red = 0xC0
-            self.grn = 0xC0
-            self.blu = 0xC0
-        elif (name == self.COLOR_RED):
-            self.red = 0xFF
-            self.grn = 0x00
-            self.blu = 0x00
-        elif (name == self.COLOR_GREEN):
-            self.red = 0x00
-            self.grn = 0xFF
-            self.blu = 0x00
-        elif (name == self.COLOR_BLUE):
-            self.red = 0x00
-            self.grn = 0x00
-            self.blu = 0xFF
-        elif (name == self.COLOR_CYAN):
-            self.red = 0x00
-            self.grn = 0xFF
-            self.blu = 0xFF
-        elif (name == self.COLOR_MAGENTA):
-            self.red = 0xFF
-            self.grn = 0x00
-            self.blu = 0xFF
-        elif (name == self.COLOR_YELLOW):
-            self.red = 0xFF
-            self.grn = 0xFF
-            self.blu = 0x00
-        elif (name == self.COLOR_DARK_RED):
-            self.red = 0x80
-            self.grn = 0x00
-            self.blu = 0x00
-        elif (name == self.COLOR_DARK_GREEN):
-            self.red = 0x00
-            self.grn = 0x80
-            self.blu = 0x00
-        elif (name == self.COLOR_DARK_BLUE):
-            self.red = 0x00
-            self.grn = 0x00
-            self.blu = 0x80
-        elif (name == self.COLOR_DARK_CYAN):
-            self.red = 0x00
-            self.grn = 0x80
-            self.blu = 0x80
-        elif (name == self.COLOR_DARK_MAGENTA):
-            self.red = 0x80
-            self.grn = 0x00
-            self.blu = 0x80
-        elif (name == self.COLOR_DARK_YELLOW):
-            self.red = 0x80
-            self.grn = 0x80
-            self.blu = 0x00
-        elif (name == self.COLOR_ORANGE):
-            self.red = 0xFF
-            self.grn = 0xA5
-            self.blu = 0x00    
-        elif (name == self.COLOR_DARK_VIOLET):
-            self.red = 0x94
-            self.grn = 0x00
-            self.blu = 0xD3    
-        elif (name == self.COLOR_TRANSPARENT):
-            self.red   = 0x00
-            self.grn   = 0x00
-            self.blu   = 0x00
-            self.alpha = 0x00 # Set alpha to transparent
-        elif (name == self.COLOR_INVALID):
-            self.cspec = self.CSPEC_INVALID
-            self.red   = 0xFFFF
-            self.grn   = 0xFFFF
-            self.blu   = 0xFFFF
-            self.alpha = 0xFFFF
-            
+        # Set the color by name using the lookup table.
+        entry = self._NAME_TABLE.get(name)
+        if entry is not None:
+            (self.red, self.grn, self.blu, a) = entry
+            if a is not None:
+                self.alpha = a
+            if (name == self.COLOR_INVALID):
+                self.cspec = self.CSPEC_INVALID
+
             
+    # ------------------------------------------------------------------------
+    @classmethod
+    def encodedByName(cls, name, alpha=0xFF):
+        """
+        Return the serialized byte stream for a pre-defined color name.
+        Fully opaque pre-defined colors are served from a cache built at
+        module load, bypassing setByName() and encode() entirely.
+
+        Parameters
+        ----------
+        name : int
+            The pre-defined Qt color name (e.g., QColor.COLOR_DARK_GRAY)
+        alpha : int
+            Optional alpha value.  Set to fully opaque (255) if not specified.
+
+        Returns
+        -------
+        A bytes object containing the encoded color.
+        """
+        data = cls._ENCODED_CACHE.get((name, alpha))
+        if data is None:
+            data = bytes(cls(name=name, alpha=alpha).encode())
+        return data
+
     # ------------------------------------------------------------------------
     def setByValue(self, red=-1, grn=-1, blu=-1, *, alpha=-1, rgba=None):
         """
@@ -451,6 +465,13 @@ class QColor (object):
             if (blu >= 0): self.blu = blu & 0xFF
 
 
+# Pre-encode the fully opaque version of each pre-defined color name.
+for _name in QColor._NAME_TABLE:
+    QColor._ENCODED_CACHE[(_name, 0xFF)] = \
+        bytes(QColor(name=_name).encode())
+del _name
+
+
 ###############################################################################
 # Main program.
 # Quick smoke test of QColor methods.
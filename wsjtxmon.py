@@ -41,17 +41,17 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE 
 # POSSIBILITY OF SUCH DAMAGE.
 ###############################################################################
-from __future__ import print_function
-
 # System level packages.
+import datetime
+import functools
 import getopt
 import os
+import selectors
 import socket
+import struct
 import sys
 
 # Local packages.
-import decode
-import encode
 from QColor import QColor
 
 
@@ -59,11 +59,65 @@ from QColor import QColor
 # Global objects and data.
 ##############################################################################
 
+# Pre-compiled structs for the big-endian WSJT-X wire format.
+# Scalar fields.
+_U32 = struct.Struct('>I')
+_I32 = struct.Struct('>i')
+_U64 = struct.Struct('>Q')
+
+# Incoming datagram header: magic number, schema, message number.
+_PKT_HDR = struct.Struct('>III')
+
+# Outgoing message header: magic number, schema, message number, ID length.
+_MSG_HDR = struct.Struct('>IIII')
+
+# Fixed-width field runs within specific messages.
+_DECODE_FIELDS  = struct.Struct('>BIidI')  # new, elapsed_ms, snr, delta_time, freq
+_STATUS_FIELDS1 = struct.Struct('>3BII')   # tx_enable, tx_now, decoding, rx_df, tx_df
+_STATUS_FIELDS2 = struct.Struct('>BBII')   # fastmode, specialopmode, freq_tol, tr_period
+_QSO_TIMESTAMP  = struct.Struct('>QIB')    # QDate, ms since midnight, timespec
+_WSPR_FIELDS    = struct.Struct('>BIidQi') # new, elapsed_ms, snr, delta_time, freq, drift
+
+# Julian Day number of the Unix Epoch (01-Jan-1970) used for date conversion.
+_UNIX_EPOCH_DATE = datetime.date(1970, 1, 1)
+_UNIX_EPOCH_JD   = 2440588
+
 
 ##############################################################################
 # Functions.
 ##############################################################################
 
+# ----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=4096)
+def _utf8(payload):
+    """
+    Decode a short UTF-8 field payload to an interned string.
+    Memoized: message IDs, mode letters and callsigns repeat constantly,
+    so repeats skip the codec and share one string object.  The LRU bound
+    evicts stale entries instead of refusing new ones.
+
+    Parameters
+    ----------
+    payload : bytes
+        The raw field payload.
+
+    Returns
+    -------
+    utf8_str : str
+        The converted string.
+    """
+    return sys.intern(str(payload, 'utf-8'))
+
+
+# ----------------------------------------------------------------------------
+class _MalformedMessage(Exception):
+    """
+    Raised when a datagram is truncated or a string field length would
+    overrun the end of the buffer.  Caught in _parse_data() so a corrupt
+    datagram is dropped instead of publishing a partial message.
+    """
+    pass
+
 
 ###############################################################################
 # Start of wsjtxmon class.
@@ -78,26 +132,33 @@ class wsjtxmon (object):
     """
     
     # Static constants and message numbers.
-    MAGIC = int(0xADBCCBDA)
-    MSG_HEARTBEAT      = int(0)
-    MSG_STATUS         = int(1)
-    MSG_DECODE         = int(2)
-    MSG_CLEAR          = int(3)
-    MSG_REPLY          = int(4)
-    MSG_QSO_LOGGED     = int(5)
-    MSG_CLOSE          = int(6)
-    MSG_REPLAY         = int(7)
-    MSG_HALT_TX        = int(8)
-    MSG_FREE_TEXT      = int(9)
-    MSG_WSPR_DECODE    = int(10)
-    MSG_LOCATION       = int(11)
-    MSG_ADIF_LOGGED    = int(12)
-    MSG_HIGHLIGHT_CALL = int(13)
-    MSG_SWITCH_CONFIG  = int(14)
-    MSG_CONFIGURE      = int(15)
-    MSG_SOCKET_ERROR   = int(97) # Not part of WSJT-X spec, added here
-    MSG_TIMEOUT        = int(98) # Not part of WSJT-X spec, added here
-    MSG_NONE           = int(99) # Not part of WSJT-X spec, added here
+    MAGIC = 0xADBCCBDA
+    MSG_HEARTBEAT      = 0
+    MSG_STATUS         = 1
+    MSG_DECODE         = 2
+    MSG_CLEAR          = 3
+    MSG_REPLY          = 4
+    MSG_QSO_LOGGED     = 5
+    MSG_CLOSE          = 6
+    MSG_REPLAY         = 7
+    MSG_HALT_TX        = 8
+    MSG_FREE_TEXT      = 9
+    MSG_WSPR_DECODE    = 10
+    MSG_LOCATION       = 11
+    MSG_ADIF_LOGGED    = 12
+    MSG_HIGHLIGHT_CALL = 13
+    MSG_SWITCH_CONFIG  = 14
+    MSG_CONFIGURE      = 15
+    MSG_SOCKET_ERROR   = 97 # Not part of WSJT-X spec, added here
+    MSG_TIMEOUT        = 98 # Not part of WSJT-X spec, added here
+    MSG_NONE           = 99 # Not part of WSJT-X spec, added here
+
+    # Receive buffer length in bytes; the largest WSJT-X datagram is far
+    # smaller than this.
+    RECV_BUFLEN = 2048
+
+    # Longest UTF-8 field payload worth memoizing, in bytes.
+    UTF8_CACHE_MAX_LEN = 32
 
     # ------------------------------------------------------------------------
     def __init__(self, verbose=False):
@@ -124,30 +185,41 @@ class wsjtxmon (object):
         """
         
         # Variable initialization.
-        self.__version__ = str("0.2")  # Version per PEP 396
-        self.class_name  = str(type(self).__name__)
-        self.IpAddr  = str("")
-        self.IpPort  = int(0)
-        self.DstAddr = str("")
-        self.MsgId   = str("WSJTXMON")  # Message ID (unique key)
+        self.__version__ = '0.2'  # Version per PEP 396
+        self.class_name  = type(self).__name__
+        self.IpAddr  = ''
+        self.IpPort  = 0
+        self.DstAddr = ''
+        self.MsgId   = 'WSJTXMON'  # Message ID (unique key)
         self.Verbose = verbose        
-        self.Message = [self.MSG_NONE]
+        self.Message = (self.MSG_NONE,)
         self.Reply   = bytearray(0)
-        self.Schema  = int(0)
-        self.Timeout = int(16)
-        
-        # WSJT-X data is transferred in big-endian format.
-        self._endian = 'big'
-        
+        self.Schema  = 0
+        self.Timeout = 16
+
+        # Reusable receive buffer.  recvfrom_into() fills this in place so
+        # steady-state receives do not allocate a new bytes object per
+        # datagram.
+        self._recv_buf = bytearray(self.RECV_BUFLEN)
+
+        # Pre-build the outgoing message header prefixes.
+        self._rebuild_prefixes()
+
         # Initialize the UDP socket.
+        # The socket is non-blocking; receive timeouts are handled with a
+        # selector wait so get_message() never parks inside recvfrom.
         self.Socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.Socket.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.Socket, selectors.EVENT_READ)
 
     # ------------------------------------------------------------------------
     def __del__(self):
         """
         Class destructor.
         Closes the UDP port.
-        """ 
+        """
+        self._selector.close()
         self.Socket.close()
 
 
@@ -155,14 +227,14 @@ class wsjtxmon (object):
     # Class methods intended to be public.
     ###########################################################################
     
-    def bind(self, ip_addr, ip_port, timeout=16):
+    def bind(self, ip_addr, ip_port, timeout=16, rcvbuf=12582912):
         """
         Bind the UDP socket to the specified IP address and port.
-        
+
         Parameters
         ----------
         ip_addr : str
-            The local IP address to monitor.  
+            The local IP address to monitor.
             WSJT-X must be configured to send packets to this address.
         ip_port : int
             The local port number to monitor.
@@ -170,7 +242,12 @@ class wsjtxmon (object):
         timeout : int
             The socket listen timeout in seconds.
             WSJT-X is expected to send UDP packets at least every 15 seconds.
-        
+        rcvbuf : int
+            The requested kernel receive buffer size in bytes.  A large
+            buffer absorbs end-of-period decode bursts without drops.
+            Note that the kernel may cap the size (net.core.rmem_max on
+            Linux).
+
         Returns
         -------
         (status, err_msg) : tuple
@@ -185,22 +262,30 @@ class wsjtxmon (object):
         # Expecting data at least every 15 seconds.
         # We are the server and listen on our IP address.
         # WSJT-X must be configured to send packets to our address.
-        self.IpAddr  = str(ip_addr)
+        self.IpAddr  = ip_addr
         self.IpPort  = int(ip_port)
         self.Timeout = int(timeout)
         
         # Close existing socket.
         # Ignore errors.
         try:
+            self._selector.unregister(self.Socket)
             self.Socket.close()
         except Exception as err:
             pass
-        
+
         # Initialize the UDP socket and bind to the IP address and port.
+        # Enlarge the kernel receive buffer and allow address reuse so
+        # multiple monitors can share the port where supported.
         try:
             self.Socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.Socket.settimeout(self.Timeout)
+            self.Socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, int(rcvbuf))
+            self.Socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, 'SO_REUSEPORT'):
+                self.Socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            self.Socket.setblocking(False)
             self.Socket.bind((self.IpAddr, self.IpPort))
+            self._selector.register(self.Socket, selectors.EVENT_READ)
             status = True
         except Exception as err:
             err_msg = str(err)
@@ -212,7 +297,7 @@ class wsjtxmon (object):
         """
         Get the next message from the UDP port.
         Blocks until message received, socket timeout, or socket error.
-        Message is available in the self.Message variable as a list.
+        Message is available in the self.Message variable as a tuple.
         
         Parameters
         ----------
@@ -225,24 +310,68 @@ class wsjtxmon (object):
             Returns True on a timeout and False if a socket error occurs.
         """
         ok = False
-        self.Message = [self.MSG_NONE]
+        self.Message = (self.MSG_NONE,)
         try:
-            data, self.DstAddr = self.Socket.recvfrom(2048) # buffer size is 2048 bytes
-            self._parse_data(data)
-            ok = True
-        except socket.timeout as err:
-            self.Message = [self.MSG_TIMEOUT, str(err)]
+            if not self._selector.select(self.Timeout):
+                self.Message = (self.MSG_TIMEOUT, 'timed out')
+                if self.Verbose:
+                    self._print_error("get_message: timed out")
+                return True
+            nbytes, self.DstAddr = self.Socket.recvfrom_into(self._recv_buf)
+            self._parse_data(memoryview(self._recv_buf)[:nbytes])
             ok = True
-            if self.Verbose:
-                self._print_error("get_message: " + str(err))
         except Exception as err:
-            self.Message = [self.MSG_SOCKET_ERROR, str(err)]
+            self.Message = (self.MSG_SOCKET_ERROR, str(err))
             if self.Verbose:
                 self._print_error("get_message: " + str(err))
         return ok
 
-    # ------------------------------------------------------------------------    
-    def send_highlight(self, call, *, 
+    # ------------------------------------------------------------------------
+    def get_messages(self, max_batch=32):
+        """
+        Get a burst of messages from the UDP port.
+        Blocks until the first message arrives, then drains any further
+        datagrams already queued on the socket without blocking.  WSJT-X
+        commonly sends a burst of decode messages at the end of each T/R
+        period; draining them together amortizes the per-message overhead.
+
+        Parameters
+        ----------
+        max_batch : int
+            The maximum number of messages to return per call.
+
+        Returns
+        -------
+        msg_list : list
+            The parsed messages in arrival order.  Each entry has the same
+            format as self.Message.  The list is empty if a socket error
+            occurs on the first receive.
+        """
+        msg_list = []
+        if not self.get_message():
+            return msg_list
+        msg_list.append(self.Message)
+        if (self.Message[0] == self.MSG_TIMEOUT):
+            return msg_list
+
+        # Drain queued datagrams without blocking.
+        # The socket is non-blocking, so recvfrom_into() raises
+        # BlockingIOError as soon as the queue is empty.
+        while (len(msg_list) < max_batch):
+            try:
+                nbytes, self.DstAddr = self.Socket.recvfrom_into(self._recv_buf)
+            except (BlockingIOError, socket.timeout):
+                break
+            except Exception as err:
+                self.Message = (self.MSG_SOCKET_ERROR, str(err))
+                msg_list.append(self.Message)
+                break
+            self._parse_data(memoryview(self._recv_buf)[:nbytes])
+            msg_list.append(self.Message)
+        return msg_list
+
+    # ------------------------------------------------------------------------
+    def send_highlight(self, call, *,
         bg_name=QColor.COLOR_YELLOW, 
         fg_name=QColor.COLOR_BLACK, 
         bg_rgba=None, 
@@ -281,28 +410,27 @@ class wsjtxmon (object):
             True if successful, False otherwise
         """
         ok = False
-        bgcolor = QColor(name=bg_name)
-        fgcolor = QColor(name=fg_name)
         ilast = 0
         if last: ilast = 1
-        
-        # RGBA values override color names.
+
+        # RGBA values override color names.  Named colors are served from
+        # the pre-encoded cache without constructing a QColor object.
         if (bg_rgba is not None):
-            bgcolor.setByValue(rgba=bg_rgba)
+            bg_bytes = QColor(rgba=bg_rgba).encode()
+        else:
+            bg_bytes = QColor.encodedByName(bg_name)
         if (fg_rgba is not None):
-            fgcolor.setByValue(rgba=fg_rgba)
-        
-        # Create the message buffer.
-        data = bytearray(encode.ulong(self.MAGIC, self._endian))    # Magic number
-        data.extend(encode.ulong(self.Schema, self._endian))        # Schema
-        data.extend(encode.ulong(wsjtxmon.MSG_HIGHLIGHT_CALL, self._endian)) # Message number
-        data.extend(encode.ulong(len(self.MsgId), self._endian))    # Message ID (unique key) length
-        data.extend(encode.string(self.MsgId))                      # Message ID (unique key) string
-        data.extend(encode.ulong(len(call), self._endian))          # Callsign length
-        data.extend(encode.string(call))                            # Callsign string
-        data.extend(bgcolor.encode())                               # Background color
-        data.extend(fgcolor.encode())                               # Foreground color
-        data.extend(encode.byte(ilast, self._endian))               # Highlight Last period only flag      
+            fg_bytes = QColor(rgba=fg_rgba).encode()
+        else:
+            fg_bytes = QColor.encodedByName(fg_name)
+
+        # Create the message buffer from the pre-built header prefix.
+        data = bytearray(self._highlight_prefix)
+        data.extend(_U32.pack(len(call)))                           # Callsign length
+        data.extend(call.encode('utf-8'))                           # Callsign string
+        data.extend(bg_bytes)                                       # Background color
+        data.extend(fg_bytes)                                       # Foreground color
+        data.append(ilast)                                          # Highlight Last period only flag
         # Send it.
         try:
             self.Socket.sendto(data, self.DstAddr)
@@ -314,25 +442,25 @@ class wsjtxmon (object):
         return ok
 
     # ------------------------------------------------------------------------    
-    def send_reply(self, reply=bytearray(0)):
+    def send_reply(self, reply=None):
         """
         Send a reply to to WSJT-X.
-        The reply message of the last successful decode message is contained 
+        The reply message of the last successful decode message is contained
         in the self.Reply variable as a byte array.
-        
+
         Parameters
         ----------
         reply : bytearray
             The reply message as a byte array.  If not specified, then the
             a reply of the last successful decode message is sent.
-        
+
         Returns
         -------
         status : bool
             True if successful, False otherwise.
         """
         ok = False
-        if (len(reply) < 2): reply = self.Reply
+        if (reply is None) or (len(reply) < 2): reply = self.Reply
         
         try:
             self.Socket.sendto(reply, self.DstAddr)
@@ -342,69 +470,122 @@ class wsjtxmon (object):
                 self._print_error("send_reply: " + str(err))
         return ok
 
+    # ------------------------------------------------------------------------
+    def send_replies(self, replies):
+        """
+        Send a batch of reply messages to WSJT-X.
+        Hoists the socket and destination address lookups out of the send
+        loop so a burst of replies pays the attribute access cost once.
+
+        Parameters
+        ----------
+        replies : iterable
+            The reply messages to send, each as a byte array.
+
+        Returns
+        -------
+        count : int
+            The number of replies sent successfully.
+        """
+        count = 0
+        sendto = self.Socket.sendto
+        dst_addr = self.DstAddr
+        for reply in replies:
+            try:
+                sendto(reply, dst_addr)
+                count += 1
+            except Exception as err:
+                if self.Verbose:
+                    self._print_error("send_replies: " + str(err))
+        return count
+
 
     ###########################################################################
     # Class methods intended to be private.
     ###########################################################################
-    
+
+    def _make_prefix(self, msg_num):
+        """
+        Build the fixed header prefix (magic number, schema, message number,
+        message ID) for an outgoing message of the specified type.
+
+        Parameters
+        ----------
+        msg_num : int
+            The WSJT-X message number.
+
+        Returns
+        -------
+        prefix : bytes
+            The encoded header prefix.
+        """
+        return _MSG_HDR.pack(self.MAGIC, self.Schema, msg_num,
+            len(self.MsgId)) + self.MsgId.encode('utf-8')
+
+    # ------------------------------------------------------------------------
+    def _rebuild_prefixes(self):
+        """
+        Pre-build the header prefixes of the outgoing REPLY and
+        HIGHLIGHT CALLSIGN messages.  The prefixes are fixed for a given
+        schema number, so they are built once here rather than on every
+        send or decode, and rebuilt only when the schema changes.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self._reply_prefix     = self._make_prefix(self.MSG_REPLY)
+        self._highlight_prefix = self._make_prefix(self.MSG_HIGHLIGHT_CALL)
+        self._prefix_schema    = self.Schema
+
+    # ------------------------------------------------------------------------
     def _make_date_str(self, julian_day):
         """
         Convert Julian Day number to a year, month, day string.
-        Algorithm found here: https://quasar.as.utexas.edu/BillInfo/JulianDatesG.html
-        
+        Offsets from the Unix Epoch and lets the C-implemented datetime
+        module do the calendar arithmetic.
+
         Parameters
         ----------
         julian_day : int
-            The Julian Day to convert.  The Julian Day for the Unix Epoch 
+            The Julian Day to convert.  The Julian Day for the Unix Epoch
             is 2440588 and should convert to 01-Jan-1970.
-        
+
         Returns
         -------
         date_str : str
             The date string in the format "YYYYMMDD"
         """
-        Z = int(julian_day)
-        W = int((Z-1867216.25)/36524.25)
-        X = int(W/4)
-        A = Z+1+W-X
-        B = A+1524
-        C = int((B-122.1)/365.25)
-        D = int(365.25*C)
-        E = int((B-D)/30.6001)
-        F = int(30.6001*E)
-        day = B-D-F
-        month = E-1
-        if (month > 12): 
-            month -= 12
-        if (month < 3):
-            year = C-4715
-        else:
-            year = C-4716
-        date_str = str("%04d" % year) + str("%02d" % month) + str("%02d" % day)
-        return date_str
+        date = _UNIX_EPOCH_DATE + \
+            datetime.timedelta(days=(int(julian_day) - _UNIX_EPOCH_JD))
+        return date.strftime('%Y%m%d')
 
     # ------------------------------------------------------------------------    
-    def _make_time_str(self, elapsed_ms):
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _make_time_str(elapsed_ms):
         """
         Convert milliseconds since midnight to an hours, minutes, seconds string.
-        
+        Memoized: every decode in a T/R period carries the same timestamp,
+        so a burst computes the string once.
+
         Parameters
         ----------
         elapsed_ms : int
             The elapsed milliseconds since midnight of the current day.
-        
+
         Returns
         -------
         time_str : str
             The time string in the format "HHMMSS"
         """
-        elapsed_seconds = int(elapsed_ms / 1000)
-        hours = int(elapsed_seconds / 3600)
-        remaining_seconds = int(elapsed_seconds - (hours * 3600))
-        minutes = int(remaining_seconds / 60)
-        seconds = int(remaining_seconds - (minutes * 60))
-        time_str = str("%02d" % hours) + str("%02d" % minutes) + str("%02d" % seconds)
-        return time_str
+        (minutes, seconds) = divmod(int(elapsed_ms) // 1000, 60)
+        (hours, minutes) = divmod(minutes, 60)
+        return f'{hours:02d}{minutes:02d}{seconds:02d}'
 
     # ------------------------------------------------------------------------    
     def _print_error(self, msg):
@@ -436,485 +617,500 @@ class wsjtxmon (object):
         -------
         None
         """
-        for d in data:
-            sys.stderr.write("%02X " % (d))
-        print(" ")
+        sys.stderr.write(bytes(data).hex(' ').upper() + '\n')
 
-    # ------------------------------------------------------------------------    
-    def _parse_utf8(self, data):
+    # ------------------------------------------------------------------------
+    def _parse_utf8(self, data, index=0):
         """
-        Convert a byte array to a UTF-8 encoded string.
-        
+        Read a UTF-8 encoded string from the data buffer at the given index.
+
         Type utf8 is a utf-8 byte string formatted as a QByteArray for
         serialization purposes (currently a quint32 size followed by size
         bytes, no terminator is present or counted).
-        
+
         Parameters
         ----------
         data : bytearray
-            The data array to convert.
-        
+            The data array containing the string.
+        index : int
+            The buffer index of the string length word.
+
         Returns
         -------
-        (utf8_len, utf8_str) : tuple
-            utf8_len : int
-                The string length.
+        (next_index, utf8_str) : tuple
+            next_index : int
+                The buffer index just past the end of the string.
             utf8_str : str
                 The converted string.
         """
-        utf8_len = decode.ulong(data[0:4], self._endian)
-        if (utf8_len == 0xFFFFFFFF):  # Null string indicator
-            utf8_len = 0
-            utf8_str = str("")
+        (utf8_len,) = _U32.unpack_from(data, index)
+        index += 4
+        if (utf8_len == 0) or (utf8_len == 0xFFFFFFFF):  # Empty or null string
+            utf8_str = ''
         else:
-            utf8_str = decode.string(data[4:], utf8_len, 'utf-8')
-        return utf8_len, utf8_str
-   
-    # ------------------------------------------------------------------------    
-    def _parse_adif_logged(self, data):
+            end = index + utf8_len
+            if (end > len(data)):
+                raise _MalformedMessage(
+                    'string field length %d overruns buffer' % utf8_len)
+            if (utf8_len <= self.UTF8_CACHE_MAX_LEN):
+                # Short fields (IDs, modes, callsigns) repeat constantly;
+                # the memoized decoder interns each distinct payload once.
+                utf8_str = _utf8(bytes(data[index:end]))
+            else:
+                utf8_str = str(data[index:end], 'utf-8')
+            index = end
+        return index, utf8_str
+
+    # ------------------------------------------------------------------------
+    def _parse_utf8_run(self, data, index, count):
+        """
+        Read a run of consecutive UTF-8 encoded strings from the data buffer.
+
+        Parameters
+        ----------
+        data : bytearray
+            The data array containing the strings.
+        index : int
+            The buffer index of the first string's length word.
+        count : int
+            The number of consecutive strings to read.
+
+        Returns
+        -------
+        (next_index, utf8_list) : tuple
+            next_index : int
+                The buffer index just past the end of the last string.
+            utf8_list : list
+                The converted strings in buffer order.
+        """
+        parse_utf8 = self._parse_utf8
+        utf8_list = []
+        append = utf8_list.append
+        for _ in range(count):
+            index, utf8_str = parse_utf8(data, index)
+            append(utf8_str)
+        return index, utf8_list
+
+    # ------------------------------------------------------------------------
+    def _parse_adif_logged(self, data, index):
         """
         Parse the WSJT-X ADIF LOGGED message.
-        Results of successful parsing are available in the self.Message list.
+        Results of successful parsing are available in the self.Message tuple.
         
         Parameters
         ----------
         data : bytearray
-            The data array containing the message to parse.
+            The data array containing the datagram to parse.
+        index : int
+            The buffer index of the first message field past the header.
         
         Returns
         -------
-        None.  The parsed message is available in the self.Message list.
+        None.  The parsed message is available in the self.Message tuple.
         """
-        id_len, id_str = self._parse_utf8(data)  # Message ID string (unique key)
-        index = 4 + id_len
-        adif_len, adif_str = self._parse_utf8(data[index:])  # ADIF record
-        self.Message = [self.MSG_ADIF_LOGGED, id_str, adif_str]
+        index, id_str = self._parse_utf8(data, index)  # Message ID string (unique key)
+        index, adif_str = self._parse_utf8(data, index)  # ADIF record
+        self.Message = (self.MSG_ADIF_LOGGED, id_str, adif_str)
 
     # ------------------------------------------------------------------------    
-    def _parse_clear(self, data):
+    def _parse_clear(self, data, index):
         """
         Parse the WSJT-X CLEAR message.
-        Results of successful parsing are available in the self.Message list.
+        Results of successful parsing are available in the self.Message tuple.
         
         Parameters
         ----------
         data : bytearray
-            The data array containing the message to parse.
+            The data array containing the datagram to parse.
+        index : int
+            The buffer index of the first message field past the header.
         
         Returns
         -------
-        None.  The parsed message is available in the self.Message list.
+        None.  The parsed message is available in the self.Message tuple.
         """
         window = 0
-        id_len, id_str = self._parse_utf8(data)    # Message ID string (unique key)
-        index = 4 + id_len
+        index, id_str = self._parse_utf8(data, index)    # Message ID string (unique key)
         if (index < len(data)):
-            window = decode.byte(data[index:index+1]) # Window
+            window = data[index] # Window
             index += 1
-        self.Message = [self.MSG_CLEAR, id_str, window]
+        self.Message = (self.MSG_CLEAR, id_str, window)
 
     # ------------------------------------------------------------------------
-    def _parse_close(self, data):
+    def _parse_close(self, data, index):
         """
         Parse the WSJT-X CLOSE message.
-        Results of successful parsing are available in the self.Message list.
+        Results of successful parsing are available in the self.Message tuple.
         
         Parameters
         ----------
         data : bytearray
-            The data array containing the message to parse.
+            The data array containing the datagram to parse.
+        index : int
+            The buffer index of the first message field past the header.
         
         Returns
         -------
-        None.  The parsed message is available in the self.Message list.
+        None.  The parsed message is available in the self.Message tuple.
         """
-        id_len, id_str = self._parse_utf8(data)  # Message ID string (unique key)
-        self.Message = [self.MSG_CLOSE, id_str]
+        index, id_str = self._parse_utf8(data, index)  # Message ID string (unique key)
+        self.Message = (self.MSG_CLOSE, id_str)
 
     # ------------------------------------------------------------------------    
-    def _parse_decode(self, data):
+    def _parse_decode(self, data, index):
         """
         Parse the WSJT-X DECODE message.
-        Results of successful parsing are available in the self.Message list.
+        Results of successful parsing are available in the self.Message tuple.
         
         Parameters
         ----------
         data : bytearray
-            The data array containing the message to parse.
+            The data array containing the datagram to parse.
+        index : int
+            The buffer index of the first message field past the header.
         
         Returns
         -------
-        None.  The parsed message is available in the self.Message list.
+        None.  The parsed message is available in the self.Message tuple.
         """
         
-        # Initialize the reply buffer.
-        self.Reply = bytearray(encode.ulong(self.MAGIC, self._endian))
-        self.Reply.extend(encode.ulong(self.Schema, self._endian))
-        self.Reply.extend(encode.ulong(self.MSG_REPLY, self._endian))
-        self.Reply.extend(encode.ulong(len(self.MsgId), self._endian))
-        self.Reply.extend(encode.string(self.MsgId))
-        
+        # Initialize the reply buffer from the pre-built header prefix.
+        self.Reply = bytearray(self._reply_prefix)
+
         # Parse the DECODE message.
-        id_len, id_str = self._parse_utf8(data)                      # Message ID string (unique key)
-        index = 4 + id_len
-        
-        new = decode.byte(data[index:index+1])                       # New flag (0 for replay, 1 otherwise)
-        index += 1
-        
-        elapsed_ms = decode.ulong(data[index:index+4], self._endian) # Milliseconds since midnight
-        self.Reply.extend(data[index:index+4])                       # Add to reply message
-        index += 4
-        
-        snr = decode.long(data[index:index+4], self._endian)         # SNR
-        self.Reply.extend(data[index:index+4])                       # Add to reply message
-        snr_str = str("%+02d" % snr).zfill(3)
-        index += 4
-        
-        delta_time = decode.double(data[index:index+8])              # Delta time in seconds
-        self.Reply.extend(data[index:index+8])                       # Add to reply message
-        dt_str = str("%+.1f" % delta_time)
-        index += 8
-        
-        freq = decode.ulong(data[index:index+4])                     # Delta frequency
-        self.Reply.extend(data[index:index+4])                       # Add to reply message
-        df_str = str("%4d" % freq)
-        index += 4
-        
-        mode_len, mode_str = self._parse_utf8(data[index:])          # Mode string
-        self.Reply.extend(data[index:index+4])                       # Add length to reply message
-        self.Reply.extend(encode.string(mode_str))                   # Add string to reply message
-        index += 4 + mode_len
-        
-        msg_len, msg_str = self._parse_utf8(data[index:])            # Message text
-        self.Reply.extend(data[index:index+4])                       # Add length to reply message
-        self.Reply.extend(encode.string(msg_str))                    # Add string to reply message
-        index += 4 + msg_len
-        
-        low_conf = decode.byte(data[index:index+1])                  # Low confidence flag
+        index, id_str = self._parse_utf8(data, index)                      # Message ID string (unique key)
+        
+        # Unpack the fixed-width run (new flag, milliseconds since midnight,
+        # SNR, delta time, delta frequency) in a single call.
+        (new, elapsed_ms, snr, delta_time, freq) = \
+            _DECODE_FIELDS.unpack_from(data, index)
+        # Add elapsed_ms, SNR, delta time and delta frequency to the reply
+        # message.  The fields are contiguous on the wire, so one slice
+        # copies all four.
+        self.Reply.extend(data[index+1:index+21])
+        index += _DECODE_FIELDS.size
+
+        snr_str = f'{snr:+03d}'
+        dt_str = f'{delta_time:+.1f}'
+        df_str = f'{freq:4d}'
+
+        mode0 = index
+        index, mode_str = self._parse_utf8(data, index)              # Mode string
+        self.Reply.extend(data[mode0:index])                         # Add length + string to reply message
+
+        msg0 = index
+        index, msg_str = self._parse_utf8(data, index)               # Message text
+        self.Reply.extend(data[msg0:index])                          # Add length + string to reply message
+
+        low_conf = data[index]                                       # Low confidence flag
         self.Reply.extend(data[index:index+1])                       # Add to reply message
         index += 1
         
-        off_air = decode.byte(data[index:index+1])                   # Off air flag
+        off_air = data[index]                                        # Off air flag
         index += 1
         
         # Add modifiers to reply message.
-        self.Reply.extend(encode.byte(0, self._endian))
+        self.Reply.append(0)
     
         # Convert milliseconds since midnight to hours, minutes, seconds.
         time_str = self._make_time_str(elapsed_ms)
     
-        self.Message = [self.MSG_DECODE, id_str, new, time_str, snr_str, 
-            dt_str, df_str, mode_str, msg_str, low_conf, off_air]
+        self.Message = (self.MSG_DECODE, id_str, new, time_str, snr_str, 
+            dt_str, df_str, mode_str, msg_str, low_conf, off_air)
 
         #self._print_hex(self.Reply)
         #print(self.Reply)
 
     # ------------------------------------------------------------------------    
-    def _parse_heartbeat(self, data):
+    def _parse_heartbeat(self, data, index):
         """
         Parse the WSJT-X HEARTBEAT message.
-        Results of successful parsing are available in the self.Message list.
+        Results of successful parsing are available in the self.Message tuple.
         
         Parameters
         ----------
         data : bytearray
-            The data array containing the message to parse.
+            The data array containing the datagram to parse.
+        index : int
+            The buffer index of the first message field past the header.
         
         Returns
         -------
-        None.  The parsed message is available in the self.Message list.
+        None.  The parsed message is available in the self.Message tuple.
         """
-        id_len, id_str = self._parse_utf8(data)  # Message ID string (unique key)
-        index = 4 + id_len
+        index, id_str = self._parse_utf8(data, index)  # Message ID string (unique key)
         
-        max_schema = decode.ulong(data[index:index+4])    # Maximum schema number
+        max_schema = int.from_bytes(data[index:index+4], 'big')  # Maximum schema number
         index += 4
         
-        ver_len, ver_str = self._parse_utf8(data[index:]) # Version
-        index += 4 + ver_len
+        index, ver_str = self._parse_utf8(data, index) # Version
         
-        rev_len, rev_str = self._parse_utf8(data[index:]) # Revision
-        self.Message = [self.MSG_HEARTBEAT, id_str, max_schema, ver_str, rev_str]
+        index, rev_str = self._parse_utf8(data, index) # Revision
+        self.Message = (self.MSG_HEARTBEAT, id_str, max_schema, ver_str, rev_str)
 
     # ------------------------------------------------------------------------    
-    def _parse_status(self, data): 
+    def _parse_status(self, data, index): 
         """
         Parse the WSJT-X STATUS message.
-        Results of successful parsing are available in the self.Message list.
+        Results of successful parsing are available in the self.Message tuple.
         
         Parameters
         ----------
         data : bytearray
-            The data array containing the message to parse.
+            The data array containing the datagram to parse.
+        index : int
+            The buffer index of the first message field past the header.
         
         Returns
         -------
-        None.  The parsed message is available in the self.Message list.
+        None.  The parsed message is available in the self.Message tuple.
         """
-        id_len, id_str = self._parse_utf8(data)  # Message ID string (unique key)
-        index = 4 + id_len
+        index, id_str = self._parse_utf8(data, index)  # Message ID string (unique key)
         
-        freq = decode.uquad(data[index:index+8])                # Dial frequency
+        (freq,) = _U64.unpack_from(data, index)                 # Dial frequency
         index += 8
+
+        index, mode_str = self._parse_utf8(data, index)     # Mode
         
-        mode_len, mode_str = self._parse_utf8(data[index:])     # Mode
-        index += 4 + mode_len
-        
-        dxcall_len, dxcall_str = self._parse_utf8(data[index:]) # DX call
-        index += 4 + dxcall_len
-        
-        report_len, report_str = self._parse_utf8(data[index:]) # Signal report
-        index += 4 + report_len
-        
-        txmode_len, txmode_str = self._parse_utf8(data[index:]) # TX mode
-        index += 4 + txmode_len
-        
-        tx_enable = decode.byte(data[index:index+1])            # TX enable flag
-        index += 1
+        index, dxcall_str = self._parse_utf8(data, index) # DX call
         
-        tx_now = decode.byte(data[index:index+1])               # Transmitting flag
-        index += 1
+        index, report_str = self._parse_utf8(data, index) # Signal report
         
-        decoding = decode.byte(data[index:index+1])             # Decoding flag
-        index += 1
+        index, txmode_str = self._parse_utf8(data, index) # TX mode
         
-        rx_df = decode.ulong(data[index:index+4])               # RX delta frequency
-        index += 4
-        
-        tx_df = decode.ulong(data[index:index+4])               # TX delta frequency
-        index += 4
-        
-        decall_len, decall_str = self._parse_utf8(data[index:]) # DE call
-        index += 4 + decall_len
+        # Unpack the TX enable, transmitting and decoding flags plus the
+        # RX/TX delta frequencies in a single call.
+        (tx_enable, tx_now, decoding, rx_df, tx_df) = \
+            _STATUS_FIELDS1.unpack_from(data, index)
+        index += _STATUS_FIELDS1.size
+
+        index, decall_str = self._parse_utf8(data, index) # DE call
         
-        degrid_len, degrid_str = self._parse_utf8(data[index:]) # DE grid
-        index += 4 + degrid_len
+        index, degrid_str = self._parse_utf8(data, index) # DE grid
         
-        dxgrid_len, dxgrid_str = self._parse_utf8(data[index:]) # DX grid
-        index += 4 + dxgrid_len
+        index, dxgrid_str = self._parse_utf8(data, index) # DX grid
         
-        tx_watchdog = decode.byte(data[index:index+1])          # TX watchdog flag 
+        tx_watchdog = data[index]                               # TX watchdog flag 
         index += 1
         
-        submode_len, submode_str = self._parse_utf8(data[index:]) # Sub-mode
-        if (submode_len == 0):
+        index, submode_str = self._parse_utf8(data, index) # Sub-mode
+        if (submode_str == ''):
             submode_str = "."
-        index += 4 + submode_len
-        
-        fastmode = decode.byte(data[index:index+1])             # Fast mode flag 
-        index += 1
-        
-        specialopmode = decode.byte(data[index:index+1])        # Special operation mode 
-        index += 1
-        
-        freq_tol = decode.ulong(data[index:index+4])            # Frequency tolerance
-        index += 4
-        
-        tr_period = decode.ulong(data[index:index+4])           # T/R period
-        index += 4
-        
-        cfgname_len, cfgname_str = self._parse_utf8(data[index:]) # Configuration name
-        index += 4 + cfgname_len
+
+        # Unpack the fast mode flag, special operation mode, frequency
+        # tolerance and T/R period in a single call.
+        (fastmode, specialopmode, freq_tol, tr_period) = \
+            _STATUS_FIELDS2.unpack_from(data, index)
+        index += _STATUS_FIELDS2.size
+
+        index, cfgname_str = self._parse_utf8(data, index) # Configuration name
         
-        self.Message = [self.MSG_STATUS, id_str, freq, mode_str, dxcall_str, 
+        self.Message = (self.MSG_STATUS, id_str, freq, mode_str, dxcall_str, 
             report_str, txmode_str, tx_enable, tx_now, decoding, tx_df, rx_df, 
             decall_str, degrid_str, dxgrid_str, tx_watchdog, submode_str, 
-            fastmode, specialopmode, freq_tol, tr_period, cfgname_str]
+            fastmode, specialopmode, freq_tol, tr_period, cfgname_str)
 
     # ------------------------------------------------------------------------        
-    def _parse_qso_logged(self, data):
+    def _parse_qso_logged(self, data, index):
         """
         Parse the WSJT-X QSO LOGGED message.
-        Results of successful parsing are available in the self.Message list.
+        Results of successful parsing are available in the self.Message tuple.
         
         Parameters
         ----------
         data : bytearray
-            The data array containing the message to parse.
+            The data array containing the datagram to parse.
+        index : int
+            The buffer index of the first message field past the header.
         
         Returns
         -------
-        None.  The parsed message is available in the self.Message list.
+        None.  The parsed message is available in the self.Message tuple.
         """
-        id_len, id_str = self._parse_utf8(data)  # Message ID string (unique key)
-        index = 4 + id_len
+        index, id_str = self._parse_utf8(data, index)  # Message ID string (unique key)
         
         ### Time Off ###
         tz_offset = 0
-        date_off = decode.uquad(data[index:index+8])     # QDate = Julian Day Number
-        index += 8
-        time_off = decode.ulong(data[index:index+4])     # Milliseconds since midnight
-        index += 4
-        timespec = decode.byte(data[index:index+1])      # QDateTime timespec 
-        index += 1
+        (date_off, time_off, timespec) = \
+            _QSO_TIMESTAMP.unpack_from(data, index)      # QDate, ms since midnight, timespec
+        index += _QSO_TIMESTAMP.size
         if (timespec == 2):
-            tz_offset = decode.long(data[index:index+4]) # Timezone offset
+            (tz_offset,) = _I32.unpack_from(data, index) # Timezone offset
             index += 4
         date_off_str = self._make_date_str(date_off)
         time_off_str = self._make_time_str(time_off)
             
-        dxcall_len, dxcall_str = self._parse_utf8(data[index:])  # DX call
-        index += 4 + dxcall_len
-        
-        dxgrid_len, dxgrid_str = self._parse_utf8(data[index:])  # DX grid
-        index += 4 + dxgrid_len
-        
-        freq = decode.uquad(data[index:index+8])                 # Dial frequency
+        # DX call, DX grid
+        index, (dxcall_str, dxgrid_str) = self._parse_utf8_run(data, index, 2)
+
+        (freq,) = _U64.unpack_from(data, index)                  # Dial frequency
         index += 8
-        
-        mode_len, mode_str = self._parse_utf8(data[index:])      # Mode
-        index += 4 + mode_len
-        
-        report_sent_len, report_sent_str = self._parse_utf8(data[index:])  # Report sent
-        index += 4 + report_sent_len
-        
-        report_recd_len, report_recd_str = self._parse_utf8(data[index:])  # Report received
-        index += 4 + report_recd_len
-        
-        power_len, power_str = self._parse_utf8(data[index:])              # TX power
-        index += 4 + power_len
-        
-        comments_len, comments_str = self._parse_utf8(data[index:])        # Comments
-        index += 4 + comments_len
-        
-        name_len, name_str = self._parse_utf8(data[index:])                # Name
-        index += 4 + name_len
-        
+
+        # Mode, report sent, report received, TX power, comments, name
+        index, (mode_str, report_sent_str, report_recd_str,
+            power_str, comments_str, name_str) = self._parse_utf8_run(data, index, 6)
+
         ### Time On ###
-        date_on = decode.uquad(data[index:index+8])       # QDate
-        index += 8
-        time_on = decode.ulong(data[index:index+4])       # Milliseconds since midnight
-        index += 4
-        timespec = decode.byte(data[index:index+1])       # QDateTime timespec 
-        index += 1
+        (date_on, time_on, timespec) = \
+            _QSO_TIMESTAMP.unpack_from(data, index)       # QDate, ms since midnight, timespec
+        index += _QSO_TIMESTAMP.size
         if (timespec == 2):
-            tz_offset = decode.long(data[index:index+4])  # Timezone offset
+            (tz_offset,) = _I32.unpack_from(data, index)  # Timezone offset
             index += 4
         date_on_str = self._make_date_str(date_on)
         time_on_str = self._make_time_str(time_on)
 
-        opcall_len, opcall_str = self._parse_utf8(data[index:])        # Operator call
-        index += 4 + opcall_len
-        
-        mycall_len, mycall_str = self._parse_utf8(data[index:])        # My call
-        index += 4 + mycall_len
-        
-        mygrid_len, mygrid_str = self._parse_utf8(data[index:])        # My grid
-        index += 4 + mygrid_len
-        
-        exch_sent_len, exch_sent_str = self._parse_utf8(data[index:])  # Exchange sent
-        index += 4 + exch_sent_len
-        
-        exch_rcvd_len, exch_rcvd_str = self._parse_utf8(data[index:])  # Exchange received
-        index += 4 + exch_rcvd_len
-            
-        self.Message = [self.MSG_QSO_LOGGED, id_str, date_off_str, time_off_str, 
+        # Operator call, my call, my grid, exchange sent, exchange received
+        index, (opcall_str, mycall_str, mygrid_str,
+            exch_sent_str, exch_rcvd_str) = self._parse_utf8_run(data, index, 5)
+
+
+        self.Message = (self.MSG_QSO_LOGGED, id_str, date_off_str, time_off_str, 
             dxcall_str, dxgrid_str, freq, mode_str, report_sent_str, report_recd_str, 
             power_str, comments_str, name_str, date_on_str, time_on_str, opcall_str,
-            mycall_str, mygrid_str, exch_sent_str, exch_rcvd_str]
+            mycall_str, mygrid_str, exch_sent_str, exch_rcvd_str)
 
     # ------------------------------------------------------------------------        
-    def _parse_wspr_decode(self, data):
+    def _parse_wspr_decode(self, data, index):
         """
         Parse the WSJT-X WSPR DECODE message.
-        Results of successful parsing are available in the self.Message list.
+        Results of successful parsing are available in the self.Message tuple.
         
         Parameters
         ----------
         data : bytearray
-            The data array containing the message to parse.
+            The data array containing the datagram to parse.
+        index : int
+            The buffer index of the first message field past the header.
         
         Returns
         -------
-        None.  The parsed message is available in the self.Message list.
+        None.  The parsed message is available in the self.Message tuple.
         """
-        id_len, id_str = self._parse_utf8(data)  # Message ID string (unique key)
-        index = 4 + id_len
-        
-        new = decode.byte(data[index:index+1])                  # New flag (0 for replay, 1 otherwise)
-        index += 1    
-        
-        elapsed_ms = decode.ulong(data[index:index+4])          # Milliseconds since midnight
-        index += 4   
-        
-        snr = decode.long(data[index:index+4])                  # SNR
-        snr_str = str("%+02d" % snr).zfill(3)
-        index += 4
-        
-        delta_time = decode.double(data[index:index+8])         # Delta time in seconds
-        dt_str = str("%+.1f" % delta_time)
-        index += 8       
-        
-        freq = decode.uquad(data[index:index+8])                # Frequency
-        freq_str = str("%6d" % freq)
-        index += 8
+        index, id_str = self._parse_utf8(data, index)  # Message ID string (unique key)
         
-        drift = decode.long(data[index:index+4])                # Drift
-        index += 4
-        
-        dxcall_len, dxcall_str = self._parse_utf8(data[index:]) # DX call
-        index += 4 + dxcall_len
+        # Unpack the fixed-width run (new flag, milliseconds since midnight,
+        # SNR, delta time, frequency, drift) in a single call.
+        (new, elapsed_ms, snr, delta_time, freq, drift) = \
+            _WSPR_FIELDS.unpack_from(data, index)
+        index += _WSPR_FIELDS.size
+
+        snr_str = f'{snr:+03d}'
+        dt_str = f'{delta_time:+.1f}'
+        freq_str = f'{freq:6d}'
+
+
+        index, dxcall_str = self._parse_utf8(data, index) # DX call
         
-        dxgrid_len, dxgrid_str = self._parse_utf8(data[index:]) # DX grid
-        index += 4 + dxgrid_len
+        index, dxgrid_str = self._parse_utf8(data, index) # DX grid
         
-        dbm = decode.long(data[index:index+4])                  # Power in dBm
+        dbm = int.from_bytes(data[index:index+4], 'big', signed=True)  # Power in dBm
         dbm_str = str(dbm)
         index += 4
         
-        off_air = decode.byte(data[index:index+1])              # Off air flag
+        off_air = data[index]                                   # Off air flag
         index += 1
         
         # Convert milliseconds since midnight to hours, minutes, seconds.
         time_str = self._make_time_str(elapsed_ms)
         
-        self.Message = [self.MSG_WSPR_DECODE, id_str, new, time_str, snr_str, dt_str, 
-            freq_str, dxcall_str, dxgrid_str, dbm_str, off_air]
+        self.Message = (self.MSG_WSPR_DECODE, id_str, new, time_str, snr_str, dt_str, 
+            freq_str, dxcall_str, dxgrid_str, dbm_str, off_air)
 
     # ------------------------------------------------------------------------    
     def _parse_data(self, data):
         """
         Parse the data buffer received from the UDP port.
-        Results of successful parsing are available in the self.Message list.
-        
+        Results of successful parsing are available in the self.Message tuple.
+
         Parameters
         ----------
         data : bytearray
-            The data array containing the message to parse.
-        
+            The data array containing the datagram to parse.
+
         Returns
         -------
-        None.  The parsed message is available in the self.Message list.
-        """
-        self.Message = [self.MSG_NONE]
-        magic_num    = decode.ulong(data[0:4],  self._endian)
-        self.Schema  = decode.ulong(data[4:8],  self._endian)  # Schema number
-        msg_num      = decode.ulong(data[8:12], self._endian)  # Message number
-        
-        if (magic_num == self.MAGIC):
-            if (msg_num == self.MSG_HEARTBEAT):
-                self._parse_heartbeat(data[12:])
-            elif (msg_num == self.MSG_STATUS):
-                self._parse_status(data[12:])
-            elif (msg_num == self.MSG_DECODE):
-                self._parse_decode(data[12:])
-            elif (msg_num == self.MSG_CLEAR):
-                self._parse_clear(data[12:])
-            elif (msg_num == self.MSG_QSO_LOGGED):
-                self._parse_qso_logged(data[12:])
-            elif (msg_num == self.MSG_CLOSE):
-                self._parse_close(data[12:])
-            elif (msg_num == self.MSG_WSPR_DECODE):
-                self._parse_wspr_decode(data[12:])
-            elif (msg_num == self.MSG_ADIF_LOGGED):
-                self._parse_adif_logged(data[12:])
-            else:
-                self.Message = [msg_num]
+        None.  The parsed message is available in the self.Message tuple.
+        """
+        self.Message = (self.MSG_NONE,)
+
+        # Drop datagrams too short to hold the message header.
+        if (len(data) < _PKT_HDR.size):
+            if self.Verbose:
+                self._print_error("Truncated datagram")
+                self._print_hex(data)
+            return
+
+        # Unpack the magic number, schema number and message number
+        # in a single call.
+        (magic_num, schema, msg_num) = _PKT_HDR.unpack_from(data, 0)
+
+        # Reject foreign datagrams before touching any state.
+        if (magic_num != self.MAGIC):
+            if self.Verbose:
+                self._print_error("Invalid message header")
+            return
+
+        # Rebuild the outgoing header prefixes if the schema changed.
+        self.Schema = schema
+        if (schema != self._prefix_schema):
+            self._rebuild_prefixes()
+
+        handler = self._DISPATCH.get(msg_num)
+        if handler is not None:
+            # A truncated or corrupt message raises out of the parser;
+            # drop it rather than publish partial fields.  IndexError
+            # covers single-byte flag reads past a truncated buffer;
+            # OverflowError and ValueError cover garbage field values
+            # such as a Julian day outside the datetime range.
+            try:
+                handler(self, data, 12)
+            except (_MalformedMessage, struct.error, IndexError,
+                    OverflowError, ValueError) as err:
+                self.Message = (self.MSG_NONE,)
                 if self.Verbose:
-                    self._print_error("Unsupported message number: " + str(msg_num))
+                    self._print_error("Malformed message: " + str(err))
                     self._print_hex(data)
-        elif self.Verbose:
-            self._print_error("Invalid message header")
+        else:
+            self._handle_unknown(msg_num, data)
+
+    # ------------------------------------------------------------------------
+    def _handle_unknown(self, msg_num, data):
+        """
+        Handle a message number with no parser in the dispatch table.
+        Publishes the bare message number in the self.Message tuple.
+
+        Parameters
+        ----------
+        msg_num : int
+            The unrecognized message number.
+        data : bytearray
+            The full datagram, printed in hex when verbose.
+
+        Returns
+        -------
+        None.
+        """
+        self.Message = (msg_num,)
+        if self.Verbose:
+            self._print_error("Unsupported message number: " + str(msg_num))
+            self._print_hex(data)
+
+    # ------------------------------------------------------------------------
+    # Message number to parser dispatch table.  Defined at class level so
+    # every instance shares one table; entries are the plain functions and
+    # are called with the instance passed explicitly, which avoids building
+    # the table (and eight bound methods) per instance.
+    _DISPATCH = {
+        MSG_HEARTBEAT:   _parse_heartbeat,
+        MSG_STATUS:      _parse_status,
+        MSG_DECODE:      _parse_decode,
+        MSG_CLEAR:       _parse_clear,
+        MSG_QSO_LOGGED:  _parse_qso_logged,
+        MSG_CLOSE:       _parse_close,
+        MSG_WSPR_DECODE: _parse_wspr_decode,
+        MSG_ADIF_LOGGED: _parse_adif_logged,
+    }
 
 ###############################################################################
 # End of wsjtxmon class.
@@ -959,11 +1155,16 @@ if __name__ == "__main__":
 
     # Loop forever until socket error or WSJT-X application close.
     # Can also use CTRL-C to interrupt and exit.
+    # Timeouts and empty messages are only printed when verbose; skipping
+    # them keeps the hot loop from formatting output nobody asked for.
     ok = True
     while ok:
         ok = monitor.get_message()
-        print(monitor.Message)
-        if (monitor.Message[0] == monitor.MSG_CLOSE):
+        msg_num = monitor.Message[0]
+        if verbose or \
+           ((msg_num != monitor.MSG_TIMEOUT) and (msg_num != monitor.MSG_NONE)):
+            print(monitor.Message)
+        if (msg_num == monitor.MSG_CLOSE):
             ok = False
 
 # End of file.